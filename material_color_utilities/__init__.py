@@ -1,6 +1,6 @@
 from .utils.theme_utils import custom_color, theme_from_source_color, theme_from_image
 from .utils.image_utils import SourceColorFromImage
-from .utils.string_utils import hex_from_argb, parse_int_hex, argb_from_hex
+from .utils.string_utils import hex_from_argb, hex_from_argbs, parse_int_hex, argb_from_hex
 
 
 __all__ = [
@@ -9,6 +9,7 @@ __all__ = [
     "theme_from_image",
     "SourceColorFromImage",
     "hex_from_argb",
+    "hex_from_argbs",
     "parse_int_hex",
     "argb_from_hex"
 ]
\ No newline at end of file
@@ -1,9 +1,9 @@
 from ..hct.cam16 import Cam16
 from ..hct.hct import Hct
+from ..hct.viewing_conditions import ViewingConditions
 from ..utils.color_utils import lstar_from_argb
-from ..utils.math_utils import difference_degrees, sanitize_degrees_double
+from ..utils.math_utils import difference_degrees, sanitize_degrees_double, sanitize_degrees_double_njit
 
-import numpy as np
 from numba import njit
 
 
@@ -35,7 +35,7 @@ class Blend:
         difference_degrees_v = difference_degrees(from_hct.hue, to_hct.hue)
         rotation_degrees = min(difference_degrees_v * 0.5, 15.0)
         output_hue = sanitize_degrees_double(from_hct.hue + rotation_degrees * Blend.rotation_direction(from_hct.hue, to_hct.hue))
-        return Hct.from_hct(output_hue, from_hct.chroma, from_hct.tone).to_int()
+        return Hct.fromHct(output_hue, from_hct.chroma, from_hct.tone).to_int()
 
 
     @staticmethod
@@ -58,11 +58,10 @@ class Blend:
             16777215
         """
 
-        ucs = Blend.cam16_ucs(from_v, to, amount)
-        ucs_cam = Cam16.from_int(ucs)
-        from_cam = Cam16.from_int(from_v)
-        blended = Hct.from_hct(ucs_cam.hue, from_cam.chroma, lstar_from_argb(from_v))
-        return blended.toInt()
+        ucs, from_cam = Blend._cam16_ucs(from_v, to, amount)
+        ucs_cam = Cam16.from_int_default(ucs, compute_full=False)
+        blended = Hct.fromHct(ucs_cam.hue, from_cam.chroma, lstar_from_argb(from_v))
+        return blended.to_int()
 
 
     @staticmethod
@@ -85,22 +84,36 @@ class Blend:
             16777215
         """
 
-        from_cam = Cam16.from_int(from_v)
-        to_cam = Cam16.from_int(to)
+        return Blend._cam16_ucs(from_v, to, amount)[0]
+
+
+    @staticmethod
+    def _cam16_ucs(from_v, to, amount):
+        """
+        cam16_ucs that also returns the Cam16 of the starting color, so callers
+        that need it do not convert it a second time. Only the CAM16-UCS
+        coordinates, hue, chroma and J are computed.
+
+        Returns:
+            tuple: The blended color and the Cam16 of from_v.
+        """
+
+        from_cam = Cam16.from_int_in_viewing_conditions(from_v, ViewingConditions.DEFAULT, compute_full=False)
+        to_cam = Cam16.from_int_in_viewing_conditions(to, ViewingConditions.DEFAULT, compute_full=False)
         fromj = from_cam.jstar
         froma = from_cam.astar
         fromb = from_cam.bstar
         toj = to_cam.jstar
         toa = to_cam.astar
-        toa = to_cam.bstar
+        tob = to_cam.bstar
         jstar = fromj + (toj - fromj) * amount
         astar = froma + (toa - froma) * amount
-        bstar = fromb + (toa - fromb) * amount
-        return Cam16.from_ucs(jstar, astar, bstar).to_int()
+        bstar = fromb + (tob - fromb) * amount
+        return Cam16.from_ucs(jstar, astar, bstar).to_int(), from_cam
 
 
     @staticmethod
-    @njit
+    @njit("float64(float64, float64)", cache=True)
     def rotation_direction(from_v, to):
         """
         Determine the rotation direction between two angles.
@@ -119,7 +132,7 @@ class Blend:
             -1.0
         """
 
-        values = np.array([to - from_v, to - from_v + 360.0, to - from_v - 360.0])
-        abs_values = np.abs(values)
-        min_index = np.argmin(abs_values)
-        return np.sign(values[min_index])
+        # Rotate clockwise when the clockwise wrap-around distance is no longer;
+        # an exact half turn goes clockwise, matching the reference implementation.
+        d = sanitize_degrees_double_njit(to - from_v)
+        return 1.0 if d <= 180.0 else -1.0
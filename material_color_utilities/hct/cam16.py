@@ -1,11 +1,133 @@
-from ..utils.color_utils import linearized, argb_from_xyz
-from ..utils.math_utils import signum
+from ..utils.color_utils import LINEARIZED_LUT, argb_from_xyz, argbs_from_xyz, xyz_from_argbs
+from ..utils.math_utils import signum, signum_njit
 from ..hct.viewing_conditions import ViewingConditions
 import math
 
 import numpy as np
 from numba import njit
 
+_DEFAULT_CONSTANTS = ViewingConditions.DEFAULT._cam16_constants
+
+_DEG_PER_RAD = 180.0 / math.pi
+_RAD_PER_DEG = math.pi / 180.0
+
+# CAM16-UCS constants c1 and c2, used for J* and M*.
+_UCS_C1 = 0.007
+_UCS_C2 = 0.0228
+
+# When True, the compiled CAM16 kernels evaluate x ** k as exp2(k * log2(x)),
+# which is faster than the generic pow but may differ from it in the last
+# bit. Set to False for output that is bit-exact with math.pow.
+CAM16_FAST_POW = True
+
+
+@njit(cache=True, inline='always')
+def _pow(x, k, fast_pow):
+    if not fast_pow:
+        return x ** k
+    if x <= 0.0:
+        return 0.0
+    return np.exp2(k * np.log2(x))
+
+
+@njit(cache=True, inline='always')
+def _from_int(argb, vc_consts, compute_full, fast_pow):
+    """
+    Scalar CAM16 forward transform. Takes the viewing conditions as the tuple of
+    floats ViewingConditions._cam16_constants so Numba can compile it; returns
+    (hue, chroma, j, q, m, s, jstar, astar, bstar).
+
+    Follows the shortened formulation of Schlömer (2018). When compute_full is
+    False, q, m and s are not computed and are returned as NaN. fast_pow selects
+    the exp2/log2 power, see CAM16_FAST_POW.
+    """
+
+    rgbD0, rgbD1, rgbD2, fl100, nbb, aw, cz, inv_c, fLRoot, p1_coef, alpha_base, vc_c = vc_consts
+    red = (argb & 0x00ff0000) >> 16
+    green = (argb & 0x0000ff00) >> 8
+    blue = (argb & 0x000000ff)
+    redL = LINEARIZED_LUT[red]
+    greenL = LINEARIZED_LUT[green]
+    blueL = LINEARIZED_LUT[blue]
+    x = 0.41233895 * redL + 0.35762064 * greenL + 0.18051042 * blueL
+    y = 0.2126 * redL + 0.7152 * greenL + 0.0722 * blueL
+    z = 0.01932141 * redL + 0.11916382 * greenL + 0.95034478 * blueL
+    rC = 0.401288 * x + 0.650173 * y - 0.051461 * z
+    gC = -0.250268 * x + 1.204414 * y + 0.045854 * z
+    bC = -0.002079 * x + 0.048952 * y + 0.953127 * z
+    rD = rgbD0 * rC
+    gD = rgbD1 * gC
+    bD = rgbD2 * bC
+    rAF = _pow(fl100 * abs(rD), 0.42, fast_pow)
+    gAF = _pow(fl100 * abs(gD), 0.42, fast_pow)
+    bAF = _pow(fl100 * abs(bD), 0.42, fast_pow)
+    rA = (signum_njit(rD) * 400.0 * rAF) / (rAF + 27.13)
+    gA = (signum_njit(gD) * 400.0 * gAF) / (gAF + 27.13)
+    bA = (signum_njit(bD) * 400.0 * bAF) / (bAF + 27.13)
+    a = (11.0 * rA + -12.0 * gA + bA) / 11.0
+    b = (rA + gA - 2.0 * bA) / 9.0
+    u = (20.0 * rA + 20.0 * gA + 21.0 * bA) / 20.0
+    p2 = (40.0 * rA + 20.0 * gA + bA) / 20.0
+    atan2 = math.atan2(b, a)
+    atanDegrees = atan2 * _DEG_PER_RAD
+    hue = atanDegrees % 360.0
+    hueRadians = hue * _RAD_PER_DEG
+    ac = p2 * nbb
+    j = 100.0 * _pow(ac / aw, cz, fast_pow)
+    # // cos is periodic, so the hue needs no shift before computing eHue.
+    eHue = 0.25 * (math.cos(hueRadians + 2.0) + 3.8)
+    p1 = p1_coef * eHue
+    t = (p1 * math.sqrt(a * a + b * b)) / (u + 0.305)
+    alpha = _pow(t, 0.9, fast_pow) * alpha_base
+    c = alpha * math.sqrt(j / 100.0)
+    q = math.nan
+    m = math.nan
+    s = math.nan
+    if compute_full:
+        q = 4.0 * inv_c * math.sqrt(j / 100.0) * (aw + 4.0) * fLRoot
+        m = c * fLRoot
+        s = 50.0 * math.sqrt((alpha * vc_c) / (aw + 4.0))
+    jstar = ((1.0 + 100.0 * _UCS_C1) * j) / (1.0 + _UCS_C1 * j)
+    mstar = (1.0 / _UCS_C2) * math.log(1.0 + _UCS_C2 * c * fLRoot)
+    astar = mstar * math.cos(hueRadians)
+    bstar = mstar * math.sin(hueRadians)
+    return (hue, c, j, q, m, s, jstar, astar, bstar)
+
+
+@njit(cache=True)
+def _from_int_default(argb, compute_full, fast_pow):
+    """
+    _from_int specialized for ViewingConditions.DEFAULT, whose constants are
+    compile-time globals that Numba folds into the code.
+    """
+
+    return _from_int(argb, _DEFAULT_CONSTANTS, compute_full, fast_pow)
+
+
+@njit(fastmath=True, cache=True)
+def cam16_batch_njit(argbs, out_j, out_a, out_b, vc_consts, fast_pow):
+    """
+    Writes the CAM16-UCS coordinates of every color in argbs to out_j, out_a and
+    out_b. The loop is serial, like argb_to_lab_batch: Numba's default workqueue
+    threading layer aborts when parallel kernels are launched from several
+    threads at once.
+
+    Args:
+        argbs (np.ndarray): The ARGB color values, as a uint32 array.
+        out_j (np.ndarray): Output array for jstar.
+        out_a (np.ndarray): Output array for astar.
+        out_b (np.ndarray): Output array for bstar.
+        vc_consts (tuple): ViewingConditions._cam16_constants.
+        fast_pow (bool): Use the exp2/log2 power, see CAM16_FAST_POW.
+    """
+
+    for i in range(argbs.shape[0]):
+        cam = _from_int(argbs[i], vc_consts, False, fast_pow)
+        out_j[i] = cam[6]
+        out_a[i] = cam[7]
+        out_b[i] = cam[8]
+
+
 # /**
 #  * CAM16, a color appearance model. Colors are not just defined by their hex
 #  * code, but rather, a hex code and viewing conditions.
@@ -65,7 +187,7 @@ class Cam16:
         dA = self.astar - other.astar
         dB = self.bstar - other.bstar
         dEPrime = math.sqrt(dJ * dJ + dA * dA + dB * dB)
-        return 1.41 * pow(dEPrime, 0.63)
+        return 1.41 * dEPrime ** 0.63
 
 
     @staticmethod
@@ -86,18 +208,18 @@ class Cam16:
             (0.9999999999999999, 0.0, 0.0)
         """
 
-        return Cam16.from_int_in_viewing_conditions(argb, ViewingConditions.DEFAULT)
+        return Cam16.from_int_default(argb)
 
 
     @staticmethod
-    @njit
-    def from_int_in_viewing_conditions(argb, viewing_conditions):
+    def from_int_in_viewing_conditions(argb, viewing_conditions, compute_full=True):
         """
         Convert an ARGB color value to a Cam16 color representation in the specified viewing conditions.
 
         Args:
             argb (int): The ARGB color value represented as an integer.
             viewing_conditions (ViewingConditions): The viewing conditions for the conversion.
+            compute_full (bool): Whether to compute q, m and s. When False they are NaN.
 
         Returns:
             Cam16: The Cam16 color representation.
@@ -109,52 +231,127 @@ class Cam16:
             Cam16(hue=0.0, chroma=0.0, jstar=0.9999999999999999, q=0.0, m=0.0, s=0.0, astar=0.0, bstar=0.0)
         """
 
+        return Cam16(*_from_int(argb, viewing_conditions._cam16_constants, compute_full, CAM16_FAST_POW))
 
-        red = (argb & 0x00ff0000) >> 16
-        green = (argb & 0x0000ff00) >> 8
-        blue = (argb & 0x000000ff)
-        redL = linearized(red)
-        greenL = linearized(green)
-        blueL = linearized(blue)
-        x = 0.41233895 * redL + 0.35762064 * greenL + 0.18051042 * blueL
-        y = 0.2126 * redL + 0.7152 * greenL + 0.0722 * blueL
-        z = 0.01932141 * redL + 0.11916382 * greenL + 0.95034478 * blueL
+
+    @staticmethod
+    def from_int_default(argb, compute_full=True):
+        """
+        Convert an ARGB color value to a Cam16 color representation in the default viewing conditions.
+
+        Args:
+            argb (int): The ARGB color value represented as an integer.
+            compute_full (bool): Whether to compute q, m and s. When False they are NaN.
+
+        Returns:
+            Cam16: The Cam16 color representation.
+        """
+
+        return Cam16(*_from_int_default(argb, compute_full, CAM16_FAST_POW))
+
+    @staticmethod
+    def from_ints_in_viewing_conditions(argbs, viewing_conditions, compute_full=True, precision='fp64'):
+        """
+        Convert an array of ARGB color values to Cam16 dimensions in the specified viewing conditions.
+
+        Every stage of the conversion runs as a NumPy array operation over the whole input.
+        precision='fp32' halves the memory traffic of every stage, which is plenty for
+        ranking and quantizing colors (Score uses it); the scalar Cam16.from_int path
+        is always fp64.
+
+        Args:
+            argbs (np.ndarray): The ARGB color values represented as integers.
+            viewing_conditions (ViewingConditions): The viewing conditions for the conversion.
+            compute_full (bool): Whether to compute q, m and s. When False they are None.
+            precision (str): The working precision, 'fp64' or 'fp32'.
+
+        Returns:
+            Cam16Batch: The Cam16 color representations, one entry per color.
+        """
+
+        if (precision == 'fp64'):
+            float_type = np.float64
+        elif (precision == 'fp32'):
+            float_type = np.float32
+        else:
+            raise ValueError('unexpected precision ' + str(precision))
+
+        # The precomputed constants are plain floats, so they keep the arrays in float_type.
+        rgbD0, rgbD1, rgbD2, fl100, nbb, aw, cz, inv_c, fLRoot, p1_coef, alpha_base, vc_c = viewing_conditions._cam16_constants
+        xyz = xyz_from_argbs(argbs, float_type)
+        x = xyz[:, 0]
+        y = xyz[:, 1]
+        z = xyz[:, 2]
         rC = 0.401288 * x + 0.650173 * y - 0.051461 * z
         gC = -0.250268 * x + 1.204414 * y + 0.045854 * z
         bC = -0.002079 * x + 0.048952 * y + 0.953127 * z
-        rD = viewing_conditions.rgbD[0] * rC
-        gD = viewing_conditions.rgbD[1] * gC
-        bD = viewing_conditions.rgbD[2] * bC
-        rAF = pow((viewing_conditions.fl * abs(rD)) / 100.0, 0.42)
-        gAF = pow((viewing_conditions.fl * abs(gD)) / 100.0, 0.42)
-        bAF = pow((viewing_conditions.fl * abs(bD)) / 100.0, 0.42)
-        rA = (signum(rD) * 400.0 * rAF) / (rAF + 27.13)
-        gA = (signum(gD) * 400.0 * gAF) / (gAF + 27.13)
-        bA = (signum(bD) * 400.0 * bAF) / (bAF + 27.13)
+        rD = rgbD0 * rC
+        gD = rgbD1 * gC
+        bD = rgbD2 * bC
+        rAF = np.power(fl100 * np.abs(rD), 0.42)
+        gAF = np.power(fl100 * np.abs(gD), 0.42)
+        bAF = np.power(fl100 * np.abs(bD), 0.42)
+        rA = (np.sign(rD) * 400.0 * rAF) / (rAF + 27.13)
+        gA = (np.sign(gD) * 400.0 * gAF) / (gAF + 27.13)
+        bA = (np.sign(bD) * 400.0 * bAF) / (bAF + 27.13)
         a = (11.0 * rA + -12.0 * gA + bA) / 11.0
         b = (rA + gA - 2.0 * bA) / 9.0
         u = (20.0 * rA + 20.0 * gA + 21.0 * bA) / 20.0
         p2 = (40.0 * rA + 20.0 * gA + bA) / 20.0
-        atan2 = math.atan2(b, a)
-        atanDegrees = (atan2 * 180.0) / math.pi
-        hue =  atanDegrees + 360.0 if atanDegrees < 0 else atanDegrees - 360.0 if atanDegrees >= 360 else atanDegrees
-        hueRadians = (hue * math.pi) / 180.0
-        ac = p2 * viewing_conditions.nbb
-        j = 100.0 * pow(ac / viewing_conditions.aw, viewing_conditions.c * viewing_conditions.z)
-        q = (4.0 / viewing_conditions.c) * math.sqrt(j / 100.0) * (viewing_conditions.aw + 4.0) * viewing_conditions.fLRoot
-        huePrime = hue + 360 if hue < 20.14 else hue
-        eHue = 0.25 * (math.cos((huePrime * math.pi) / 180.0 + 2.0) + 3.8)
-        p1 = (50000.0 / 13.0) * eHue * viewing_conditions.nc * viewing_conditions.ncb
-        t = (p1 * math.sqrt(a * a + b * b)) / (u + 0.305)
-        alpha = pow(t, 0.9) * pow(1.64 - pow(0.29, viewing_conditions.n), 0.73)
-        c = alpha * math.sqrt(j / 100.0)
-        m = c * viewing_conditions.fLRoot
-        s = 50.0 * math.sqrt((alpha * viewing_conditions.c) / (viewing_conditions.aw + 4.0))
-        jstar = ((1.0 + 100.0 * 0.007) * j) / (1.0 + 0.007 * j)
-        mstar = (1.0 / 0.0228) * math.log(1.0 + 0.0228 * m)
-        astar = mstar * math.cos(hueRadians)
-        bstar = mstar * math.sin(hueRadians)
-        return Cam16(hue, c, j, q, m, s, jstar, astar, bstar)
+        hue = np.degrees(np.arctan2(b, a)) % 360.0
+        hueRadians = np.radians(hue)
+        ac = p2 * nbb
+        j = 100.0 * np.power(ac / aw, cz)
+        eHue = 0.25 * (np.cos(hueRadians + 2.0) + 3.8)
+        p1 = p1_coef * eHue
+        t = (p1 * np.hypot(a, b)) / (u + 0.305)
+        alpha = np.power(t, 0.9) * alpha_base
+        c = alpha * np.sqrt(j / 100.0)
+        q = None
+        m = None
+        s = None
+        if compute_full:
+            q = 4.0 * inv_c * np.sqrt(j / 100.0) * (aw + 4.0) * fLRoot
+            m = c * fLRoot
+            s = 50.0 * np.sqrt((alpha * vc_c) / (aw + 4.0))
+        jstar = ((1.0 + 100.0 * _UCS_C1) * j) / (1.0 + _UCS_C1 * j)
+        mstar = (1.0 / _UCS_C2) * np.log1p(_UCS_C2 * c * fLRoot)
+        astar = mstar * np.cos(hueRadians)
+        bstar = mstar * np.sin(hueRadians)
+        return Cam16Batch(hue, c, j, q, m, s, jstar, astar, bstar)
+
+    @staticmethod
+    def ucs_from_ints_in_viewing_conditions(argbs, viewing_conditions, out=None):
+        """
+        Convert an array of ARGB color values to CAM16-UCS coordinates in the specified viewing conditions.
+
+        Runs the compiled scalar transform over every color in one call, which pays off for image-sized inputs.
+
+        Args:
+            argbs (np.ndarray): The ARGB color values represented as integers.
+            viewing_conditions (ViewingConditions): The viewing conditions for the conversion.
+            out (tuple): Optional preallocated float64 arrays (jstar, astar, bstar) to write into.
+
+        Returns:
+            tuple: Arrays of (jstar, astar, bstar), one entry per color.
+        """
+
+        argbs = np.ascontiguousarray(argbs, dtype=np.uint32)
+        if (out is None):
+            jstar = np.empty(argbs.shape[0], dtype=np.float64)
+            astar = np.empty(argbs.shape[0], dtype=np.float64)
+            bstar = np.empty(argbs.shape[0], dtype=np.float64)
+        else:
+            # The kernel writes without bounds checks, so reject buffers it could overrun.
+            if (len(out) != 3):
+                raise ValueError('out must be a tuple of 3 arrays')
+            for buffer in out:
+                if (not isinstance(buffer, np.ndarray) or buffer.ndim != 1 or buffer.dtype != np.float64
+                        or not buffer.flags.writeable or buffer.shape[0] != argbs.shape[0]):
+                    raise ValueError('out must hold writeable 1-D float64 arrays of length ' + str(argbs.shape[0]))
+            jstar, astar, bstar = out
+        cam16_batch_njit(argbs, jstar, astar, bstar, viewing_conditions._cam16_constants, CAM16_FAST_POW)
+        return (jstar, astar, bstar)
 
     # /**
     #  * @param j CAM16 lightness
@@ -178,9 +375,9 @@ class Cam16:
         m = c * viewing_conditions.fLRoot
         alpha = c / math.sqrt(j / 100.0)
         s = 50.0 * math.sqrt((alpha * viewing_conditions.c) / (viewing_conditions.aw + 4.0))
-        hueRadians = (h * math.pi) / 180.0
-        jstar = ((1.0 + 100.0 * 0.007) * j) / (1.0 + 0.007 * j)
-        mstar = (1.0 / 0.0228) * math.log(1.0 + 0.0228 * m)
+        hueRadians = h * _RAD_PER_DEG
+        jstar = ((1.0 + 100.0 * _UCS_C1) * j) / (1.0 + _UCS_C1 * j)
+        mstar = (1.0 / _UCS_C2) * math.log(1.0 + _UCS_C2 * m)
         astar = mstar * math.cos(hueRadians)
         bstar = mstar * math.sin(hueRadians)
         return Cam16(h, c, j, q, m, s, jstar, astar, bstar)
@@ -210,12 +407,12 @@ class Cam16:
         a = astar
         b = bstar
         m = math.sqrt(a * a + b * b)
-        M = (math.exp(m * 0.0228) - 1.0) / 0.0228
+        M = (math.exp(m * _UCS_C2) - 1.0) / _UCS_C2
         c = M / viewing_conditions.fLRoot
-        h = math.atan2(b, a) * (180.0 / math.pi)
+        h = math.atan2(b, a) * _DEG_PER_RAD
         if (h < 0.0):
             h += 360.0
-        j = jstar / (1 - (jstar - 100) * 0.007)
+        j = jstar / (1 - (jstar - 100) * _UCS_C1)
         return Cam16.fromJch_in_viewing_conditions(j, c, h, viewing_conditions)
 
     # /**
@@ -233,11 +430,11 @@ class Cam16:
     #  */
     def viewed(self, viewing_conditions):
         alpha =  0.0 if self.chroma == 0.0 or self.j == 0.0 else self.chroma / math.sqrt(self.j / 100.0)
-        t = pow(alpha / pow(1.64 - pow(0.29, viewing_conditions.n), 0.73), 1.0 / 0.9)
-        hRad = (self.hue * math.pi) / 180.0
+        t = (alpha / viewing_conditions._alpha_base) ** (1.0 / 0.9)
+        hRad = self.hue * _RAD_PER_DEG
         eHue = 0.25 * (math.cos(hRad + 2.0) + 3.8)
-        ac = viewing_conditions.aw * pow(self.j / 100.0, 1.0 / viewing_conditions.c / viewing_conditions.z)
-        p1 = eHue * (50000.0 / 13.0) * viewing_conditions.nc * viewing_conditions.ncb
+        ac = viewing_conditions.aw * (self.j / 100.0) ** (1.0 / viewing_conditions.c / viewing_conditions.z)
+        p1 = eHue * viewing_conditions._p1_coef
         p2 = ac / viewing_conditions.nbb
         hSin = math.sin(hRad)
         hCos = math.cos(hRad)
@@ -248,11 +445,11 @@ class Cam16:
         gA = (460.0 * p2 - 891.0 * a - 261.0 * b) / 1403.0
         bA = (460.0 * p2 - 220.0 * a - 6300.0 * b) / 1403.0
         rCBase = max(0, (27.13 * abs(rA)) / (400.0 - abs(rA)))
-        rC = signum(rA) * (100.0 / viewing_conditions.fl) * pow(rCBase, 1.0 / 0.42)
+        rC = signum(rA) * (100.0 / viewing_conditions.fl) * rCBase ** (1.0 / 0.42)
         gCBase = max(0, (27.13 * abs(gA)) / (400.0 - abs(gA)))
-        gC = signum(gA) * (100.0 / viewing_conditions.fl) * pow(gCBase, 1.0 / 0.42)
+        gC = signum(gA) * (100.0 / viewing_conditions.fl) * gCBase ** (1.0 / 0.42)
         bCBase = max(0, (27.13 * abs(bA)) / (400.0 - abs(bA)))
-        bC = signum(bA) * (100.0 / viewing_conditions.fl) * pow(bCBase, 1.0 / 0.42)
+        bC = signum(bA) * (100.0 / viewing_conditions.fl) * bCBase ** (1.0 / 0.42)
         rF = rC / viewing_conditions.rgbD[0]
         gF = gC / viewing_conditions.rgbD[1]
         bF = bC / viewing_conditions.rgbD[2]
@@ -260,3 +457,171 @@ class Cam16:
         y = 0.38752654 * rF + 0.62144744 * gF - 0.00897398 * bF
         z = -0.01584150 * rF - 0.03412294 * gF + 1.04996444 * bF
         return argb_from_xyz(x, y, z)
+
+    @staticmethod
+    def viewed_batch(hues, chromas, js, viewing_conditions):
+        """
+        Convert arrays of CAM16 hue, chroma and lightness to ARGB, as viewed in the specified viewing conditions.
+
+        The same inverse transform as viewed, run as NumPy array operations over the whole input.
+
+        Args:
+            hues (np.ndarray): CAM16 hues.
+            chromas (np.ndarray): CAM16 chromas.
+            js (np.ndarray): CAM16 lightnesses.
+            viewing_conditions (ViewingConditions): The viewing conditions the colors will be viewed in.
+
+        Returns:
+            np.ndarray: The ARGB colors, as a uint32 array.
+        """
+
+        hues = np.asarray(hues, dtype=np.float64)
+        chromas = np.asarray(chromas, dtype=np.float64)
+        js = np.asarray(js, dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            alpha = np.where((chromas == 0.0) | (js == 0.0), 0.0, chromas / np.sqrt(js / 100.0))
+        t = np.power(alpha / viewing_conditions._alpha_base, 1.0 / 0.9)
+        hRad = np.radians(hues)
+        eHue = 0.25 * (np.cos(hRad + 2.0) + 3.8)
+        ac = viewing_conditions.aw * np.power(js / 100.0, 1.0 / viewing_conditions.c / viewing_conditions.z)
+        p1 = eHue * viewing_conditions._p1_coef
+        p2 = ac / viewing_conditions.nbb
+        hSin = np.sin(hRad)
+        hCos = np.cos(hRad)
+        gamma = (23.0 * (p2 + 0.305) * t) / (23.0 * p1 + 11.0 * t * hCos + 108.0 * t * hSin)
+        a = gamma * hCos
+        b = gamma * hSin
+        rA = (460.0 * p2 + 451.0 * a + 288.0 * b) / 1403.0
+        gA = (460.0 * p2 - 891.0 * a - 261.0 * b) / 1403.0
+        bA = (460.0 * p2 - 220.0 * a - 6300.0 * b) / 1403.0
+        rCBase = np.maximum(0, (27.13 * np.abs(rA)) / (400.0 - np.abs(rA)))
+        rC = np.sign(rA) * (100.0 / viewing_conditions.fl) * np.power(rCBase, 1.0 / 0.42)
+        gCBase = np.maximum(0, (27.13 * np.abs(gA)) / (400.0 - np.abs(gA)))
+        gC = np.sign(gA) * (100.0 / viewing_conditions.fl) * np.power(gCBase, 1.0 / 0.42)
+        bCBase = np.maximum(0, (27.13 * np.abs(bA)) / (400.0 - np.abs(bA)))
+        bC = np.sign(bA) * (100.0 / viewing_conditions.fl) * np.power(bCBase, 1.0 / 0.42)
+        rF = rC / viewing_conditions.rgbD[0]
+        gF = gC / viewing_conditions.rgbD[1]
+        bF = bC / viewing_conditions.rgbD[2]
+        x = 1.86206786 * rF - 1.01125463 * gF + 0.14918677 * bF
+        y = 0.38752654 * rF + 0.62144744 * gF - 0.00897398 * bF
+        z = -0.01584150 * rF - 0.03412294 * gF + 1.04996444 * bF
+        return argbs_from_xyz(np.stack((x, y, z), axis=-1))
+
+
+# /**
+#  * A batch of CAM16 colors stored as parallel arrays, one per dimension,
+#  * instead of one Cam16 object per color. Distances and UCS conversions run
+#  * as single array operations over the whole batch.
+#  *
+#  * Indexing a batch returns the scalar Cam16 for that position.
+#  */
+class Cam16Batch:
+    def __init__(self, hue, chroma, j, q, m, s, jstar, astar, bstar):
+        self.hue = hue
+        self.chroma = chroma
+        self.j = j
+        self.q = q
+        self.m = m
+        self.s = s
+        self.jstar = jstar
+        self.astar = astar
+        self.bstar = bstar
+
+    def __len__(self):
+        return len(self.hue)
+
+    def __getitem__(self, i):
+        # Dimensions skipped with compute_full=False come back as NaN, like the scalar path.
+        q = math.nan if self.q is None else float(self.q[i])
+        m = math.nan if self.m is None else float(self.m[i])
+        s = math.nan if self.s is None else float(self.s[i])
+        return Cam16(
+            float(self.hue[i]), float(self.chroma[i]), float(self.j[i]), q, m, s,
+            float(self.jstar[i]), float(self.astar[i]), float(self.bstar[i]),
+        )
+
+    def distance(self, other):
+        """
+        CAM16-UCS distance between each color and the color at the same position in other.
+
+        Args:
+            other (Cam16Batch): Colors to measure against; broadcast like NumPy arrays.
+
+        Returns:
+            np.ndarray: The distances.
+        """
+
+        dJ = self.jstar - other.jstar
+        dA = self.astar - other.astar
+        dB = self.bstar - other.bstar
+        return 1.41 * np.power(np.sqrt(dJ * dJ + dA * dA + dB * dB), 0.63)
+
+    def distance_matrix(self, other):
+        """
+        CAM16-UCS distance between every color in this batch and every color in other.
+
+        Args:
+            other (Cam16Batch): Colors to measure against, usually a palette.
+
+        Returns:
+            np.ndarray: A len(self) x len(other) matrix of distances.
+        """
+
+        dJ = self.jstar[:, np.newaxis] - other.jstar[np.newaxis, :]
+        dA = self.astar[:, np.newaxis] - other.astar[np.newaxis, :]
+        dB = self.bstar[:, np.newaxis] - other.bstar[np.newaxis, :]
+        return 1.41 * np.power(np.sqrt(dJ * dJ + dA * dA + dB * dB), 0.63)
+
+    # /**
+    #  * @param j CAM16 lightness
+    #  * @param c CAM16 chroma
+    #  * @param h CAM16 hue
+    #  * @param viewing_conditions Information about the environment where the color
+    #  *     was observed.
+    #  */
+    @staticmethod
+    def from_jch_in_viewing_conditions(j, c, h, viewing_conditions):
+        j = np.asarray(j, dtype=np.float64)
+        c = np.asarray(c, dtype=np.float64)
+        h = np.asarray(h, dtype=np.float64)
+        q = (4.0 / viewing_conditions.c) * np.sqrt(j / 100.0) * (viewing_conditions.aw + 4.0) * viewing_conditions.fLRoot
+        m = c * viewing_conditions.fLRoot
+        # // Black has no colorfulness to saturate; keep s at 0 instead of c / 0.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            alpha = np.where(j == 0.0, 0.0, c / np.sqrt(j / 100.0))
+        s = 50.0 * np.sqrt((alpha * viewing_conditions.c) / (viewing_conditions.aw + 4.0))
+        hueRadians = np.radians(h)
+        jstar = ((1.0 + 100.0 * _UCS_C1) * j) / (1.0 + _UCS_C1 * j)
+        mstar = (1.0 / _UCS_C2) * np.log1p(_UCS_C2 * m)
+        astar = mstar * np.cos(hueRadians)
+        bstar = mstar * np.sin(hueRadians)
+        return Cam16Batch(h, c, j, q, m, s, jstar, astar, bstar)
+
+    # /**
+    #  * @param jstar CAM16-UCS lightness.
+    #  * @param astar CAM16-UCS a dimension.
+    #  * @param bstar CAM16-UCS b dimension.
+    #  */
+    @staticmethod
+    def from_ucs(jstar, astar, bstar):
+        return Cam16Batch.from_ucs_in_viewing_conditions(jstar, astar, bstar, ViewingConditions.DEFAULT)
+
+    # /**
+    #  * @param jstar CAM16-UCS lightness.
+    #  * @param astar CAM16-UCS a dimension.
+    #  * @param bstar CAM16-UCS b dimension.
+    #  * @param viewing_conditions Information about the environment where the color
+    #  *     was observed.
+    #  */
+    @staticmethod
+    def from_ucs_in_viewing_conditions(jstar, astar, bstar, viewing_conditions):
+        jstar = np.asarray(jstar, dtype=np.float64)
+        a = np.asarray(astar, dtype=np.float64)
+        b = np.asarray(bstar, dtype=np.float64)
+        m = np.hypot(a, b)
+        M = np.expm1(m * _UCS_C2) / _UCS_C2
+        c = M / viewing_conditions.fLRoot
+        h = np.degrees(np.arctan2(b, a)) % 360.0
+        j = jstar / (1 - (jstar - 100) * _UCS_C1)
+        return Cam16Batch.from_jch_in_viewing_conditions(j, c, h, viewing_conditions)
@@ -34,6 +34,26 @@ class ViewingConditions:
         self.fl = fl
         self.fLRoot = fLRoot
         self.z = z
+        self.precompute()
+
+    # /**
+    #  * Caches constants of the CAM16 forward transform that are derived only
+    #  * from the viewing conditions, so they are not recomputed for every color.
+    #  */
+    def precompute(self):
+        self._alpha_base = pow(1.64 - pow(0.29, self.n), 0.73)
+        self._p1_coef = (50000.0 / 13.0) * self.nc * self.ncb
+        self._fl_over_100 = self.fl / 100.0
+        self._inv_c = 1.0 / self.c
+        self._cz = self.c * self.z
+        # // The constants the compiled CAM16 kernels need, as a tuple of
+        # // plain floats Numba can type.
+        self._cam16_constants = (
+            float(self.rgbD[0]), float(self.rgbD[1]), float(self.rgbD[2]),
+            float(self._fl_over_100), float(self.nbb), float(self.aw),
+            float(self._cz), float(self._inv_c), float(self.fLRoot),
+            float(self._p1_coef), float(self._alpha_base), float(self.c),
+        )
 
     # /**
     #  * Create ViewingConditions from a simple, physically relevant, set of
@@ -1,16 +1,26 @@
 from ..hct.hct import *
 from ..palettes.tonal_palette import *
+from functools import lru_cache
 
 # /**
 #  * An intermediate concept between the key color for a UI theme, and a full
 #  * color scheme. 5 sets of tones are generated, all except one use the same hue
 #  * as the key color, and all vary in chroma.
 #  */
+# /**
+#  * HCT hue and chroma of a seed color, memoized by color. Only these immutable
+#  * floats are cached; every CorePalette gets its own TonalPalettes.
+#  */
+@lru_cache(maxsize=128)
+def _seed_hue_and_chroma(argb):
+    hct = Hct.from_int(argb)
+    return hct.hue, hct.chroma
+
+
 class CorePalette:
     def __init__(self, argb):
-        hct = Hct.fromInt(argb)
-        hue = hct.hue
-        self.a1 = TonalPalette.fromHueAndChroma(hue, max(48, hct.chroma))
+        hue, chroma = _seed_hue_and_chroma(argb)
+        self.a1 = TonalPalette.fromHueAndChroma(hue, max(48, chroma))
         self.a2 = TonalPalette.fromHueAndChroma(hue, 16)
         self.a3 = TonalPalette.fromHueAndChroma(hue + 60, 24)
         self.n1 = TonalPalette.fromHueAndChroma(hue, 4)
@@ -22,4 +32,4 @@ class CorePalette:
     #  */
     @staticmethod
     def of(argb):
-        return CorePalette(argb);
+        return CorePalette(argb)
@@ -1,5 +1,16 @@
 from ..hct.hct import *
 from collections import OrderedDict
+from functools import lru_cache
+
+
+# /**
+#  * Solves one tone. Memoized across palettes by value, so palettes with the
+#  * same hue and chroma share solved tones without sharing any mutable state.
+#  */
+@lru_cache(maxsize=4096)
+def _solve_tone(hue, chroma, tone):
+    return Hct.fromHct(hue, chroma, tone).to_int()
+
 
 # /**
 #  *  A convenience class for retrieving colors that are constant in hue and
@@ -18,7 +29,7 @@ class TonalPalette:
     #  */
     @staticmethod
     def fromInt(argb):
-        hct = Hct.fromInt(argb)
+        hct = Hct.from_int(argb)
         return TonalPalette.fromHueAndChroma(hct.hue, hct.chroma)
 
     # /**
@@ -35,10 +46,10 @@ class TonalPalette:
     #  * @return ARGB representation of a color with that tone.
     #  */
     def tone(self, tone):
-        argb = None
-        if (tone not in self.cache.keys()):
-            argb = Hct.fromHct(self.hue, self.chroma, tone).toInt()
+        # // Tones are solved lazily and memoized; a theme only asks each
+        # // palette for a handful of the 101 possible tones.
+        argb = self.cache.get(tone)
+        if (argb is None):
+            argb = _solve_tone(self.hue, self.chroma, tone)
             self.cache[tone] = argb
-        else:
-            argb = self.cache[tone]
         return argb
@@ -1,5 +1,7 @@
 from ..utils.color_utils import *
 
+import numpy as np
+
 # /**
 #  * Provides conversions needed for K-Means quantization. Converting input to
 #  * points, and converting the final state of the K-Means algorithm to colors.
@@ -10,13 +12,28 @@ class LabPointProvider:
     #  * coordinates of the color.
     #  */
     def fromInt(self, argb):
-        return labFromArgb(argb)
+        return lab_from_argb(argb)
+
+    # /**
+    #  * Convert an array of colors represented in ARGB to an n x 3 array of
+    #  * L*a*b* coordinates, converting all of them at once.
+    #  */
+    def fromInts(self, argbs):
+        return lab_from_argbs(argbs)
 
     # /**
     #  * Convert a 3-element array to a color represented in ARGB.
     #  */
     def toInt(self, point):
-        return argbFromLab(point[0], point[1], point[2])
+        return argd_from_lab(point[0], point[1], point[2])
+
+    # /**
+    #  * Convert a sequence of 3-element arrays to colors represented in ARGB,
+    #  * converting all of them at once.
+    #  */
+    def toInts(self, points):
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        return argbs_from_lab(points[:, 0], points[:, 1], points[:, 2])
 
     # /**
     #  * Standard CIE 1976 delta E formula also takes the square root, unneeded
@@ -1,8 +1,6 @@
 from ..quantize.quantizer_wsmeans import *
 from ..quantize.quantizer_wu import *
 
-from numba import njit
-
 # /**
 #  * An image quantizer that improves on the quality of a standard K-Means
 #  * algorithm by setting the K-Means initial state to the output of a Wu
@@ -19,20 +17,20 @@ from numba import njit
 # // namespace facilitates this.
 # //
 # // tslint:disable-next-line:class-as-namespace
-
-
-@njit
 class QuantizerCelebi:
     # /**
-    #  * @param pixels Colors in ARGB format.
+    #  * @param pixels Colors in ARGB format, either a sequence of ints or a
+    #  *     uint32 ndarray.
     #  * @param maxColors The number of colors to divide the image into. A lower
     #  *     number of colors may be returned.
+    #  * @param counts Optional number of occurrences of each pixel, for pixels
+    #  *     that were already reduced to a histogram of distinct opaque colors.
     #  * @return Map with keys of colors in ARGB format, and values of number of
     #  *     pixels in the original image that correspond to the color in the
     #  *     quantized image.
     #  */
     @staticmethod
-    def quantize(pixels, maxColors):
+    def quantize(pixels, maxColors, counts=None):
         wu = QuantizerWu()
-        wuResult = wu.quantize(pixels, maxColors)
-        return QuantizerWsmeans.quantize(pixels, wuResult, maxColors)
+        wuResult = wu.quantize(pixels, maxColors, counts)
+        return QuantizerWsmeans.quantize(pixels, wuResult, maxColors, counts)
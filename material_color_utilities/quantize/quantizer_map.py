@@ -1,6 +1,8 @@
 from ..utils.color_utils import *
 from collections import OrderedDict
 
+import numpy as np
+
 # /**
 #  * Quantizes an image into a map, with keys of ARGB colors, and values of the
 #  * number of times that color appears in the image.
@@ -12,16 +14,22 @@ from collections import OrderedDict
 # // tslint:disable-next-line:class-as-namespace
 class QuantizerMap:
     # /**
-    #  * @param pixels Colors in ARGB format.
+    #  * @param pixels Colors in ARGB format, either a sequence of ints or a
+    #  *     uint32 ndarray.
     #  * @return A Map with keys of ARGB colors, and values of the number of times
     #  *     the color appears in the image.
     #  */
     @staticmethod
     def quantize(pixels):
         countByColor = OrderedDict()
+        if (isinstance(pixels, np.ndarray)):
+            opaque = pixels[((pixels >> 24) & 255) == 255]
+            colors, counts = np.unique(opaque, return_counts=True)
+            countByColor.update(zip(colors.tolist(), counts.tolist()))
+            return countByColor
         for i in range(len(pixels)):
             pixel = pixels[i]
-            alpha = alphaFromArgb(pixel)
+            alpha = alpha_from_argb(pixel)
             if (alpha < 255):
                 continue
             countByColor[pixel] = (countByColor[pixel] if pixel in countByColor.keys() else 0) + 1
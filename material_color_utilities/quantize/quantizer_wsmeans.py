@@ -33,38 +33,43 @@ class QuantizerWsmeans:
     #  *     quality results.
     #  * @param maxColors The number of colors to divide the image into. A lower
     #  *     number of colors may be returned.
+    #  * @param inputCounts Optional number of occurrences of each input pixel.
+    #  *     When given, inputPixels are taken to be already deduplicated.
     #  * @return Colors in ARGB format.
     #  */
     # Replacing Map() with OrderedDict()
     @staticmethod
-    def quantize(inputPixels, startingClusters, maxColors):
+    def quantize(inputPixels, startingClusters, maxColors, inputCounts=None):
         random.seed(69)
-        pixelToCount = OrderedDict()
-        points = []
-        pixels = []
         pointProvider = LabPointProvider()
-        pointCount = 0
-        for i in range(len(inputPixels)):
-            inputPixel = inputPixels[i]
-            if (inputPixel not in pixelToCount.keys()):
-                pointCount += 1
-                points.append(pointProvider.fromInt(inputPixel))
-                pixels.append(inputPixel)
-                pixelToCount[inputPixel] = 1
-            else:
-                pixelToCount[inputPixel] = pixelToCount[inputPixel] + 1
-        counts = []
-        for i in range(pointCount):
-            pixel = pixels[i]
-            if (pixel in pixelToCount.keys()):
-                # counts[i] = pixelToCount[pixel]
-                counts.append(pixelToCount[pixel])
+        if (inputCounts is not None):
+            pixels = list(inputPixels)
+            counts = list(inputCounts)
+            pointCount = len(pixels)
+        else:
+            pixelToCount = OrderedDict()
+            pixels = []
+            pointCount = 0
+            for i in range(len(inputPixels)):
+                inputPixel = inputPixels[i]
+                if (inputPixel not in pixelToCount.keys()):
+                    pointCount += 1
+                    pixels.append(inputPixel)
+                    pixelToCount[inputPixel] = 1
+                else:
+                    pixelToCount[inputPixel] = pixelToCount[inputPixel] + 1
+            counts = []
+            for i in range(pointCount):
+                pixel = pixels[i]
+                if (pixel in pixelToCount.keys()):
+                    # counts[i] = pixelToCount[pixel]
+                    counts.append(pixelToCount[pixel])
+        # // Convert the distinct pixels to L*a*b* in one batch.
+        points = pointProvider.fromInts(pixels).tolist()
         clusterCount = min(maxColors, pointCount)
         if (len(startingClusters) > 0):
             clusterCount = min(clusterCount, len(startingClusters))
-        clusters = []
-        for i in range(len(startingClusters)):
-            clusters.append(pointProvider.fromInt(startingClusters[i]))
+        clusters = pointProvider.fromInts(startingClusters).tolist()
         additionalClustersNeeded = clusterCount - len(clusters)
         if (len(startingClusters) == 0 and additionalClustersNeeded > 0):
             for i in range(additionalClustersNeeded):
@@ -146,11 +151,13 @@ class QuantizerWsmeans:
                 c = componentCSums[i] / count
                 clusters[i] = [a, b, c]
         argbToPopulation = OrderedDict()
+        # // Convert every final cluster back to ARGB in one batch.
+        clusterArgbs = pointProvider.toInts(clusters).tolist()
         for i in range(clusterCount):
             count = pixelCountSums[i]
             if (count == 0):
                 continue
-            possibleNewCluster = pointProvider.toInt(clusters[i])
+            possibleNewCluster = clusterArgbs[i]
             if (possibleNewCluster in argbToPopulation.keys()):
                 continue
             argbToPopulation[possibleNewCluster] = count
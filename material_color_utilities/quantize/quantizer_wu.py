@@ -1,6 +1,8 @@
 from ..utils.color_utils import *
 from ..quantize.quantizer_map import *
 
+import numpy as np
+
 INDEX_BITS = 5
 SIDE_LENGTH = 33 # ((1 << INDEX_INDEX_BITS) + 1)
 TOTAL_SIZE = 35937 # SIDE_LENGTH * SIDE_LENGTH * SIDE_LENGTH
@@ -31,37 +33,43 @@ class QuantizerWu:
     #  * @param pixels Colors in ARGB format.
     #  * @param maxColors The number of colors to divide the image into. A lower
     #  *     number of colors may be returned.
+    #  * @param counts Optional number of occurrences of each pixel. When given,
+    #  *     pixels are taken to be distinct opaque colors, as returned by
+    #  *     np.unique(pixels, return_counts=True).
     #  * @return Colors in ARGB format.
     #  */
-    def quantize(self, pixels, maxColors):
-        self.constructHistogram(pixels)
+    def quantize(self, pixels, maxColors, counts=None):
+        self.constructHistogram(pixels, counts)
         self.computeMoments()
         createBoxesResult = self.createBoxes(maxColors)
         results = self.createResult(createBoxesResult.resultCount)
         return results
 
-    def constructHistogram(self, pixels):
-        _a = None
-        self.weights = [0] * TOTAL_SIZE
-        self.momentsR = [0] * TOTAL_SIZE
-        self.momentsG = [0] * TOTAL_SIZE
-        self.momentsB = [0] * TOTAL_SIZE
-        self.moments = [0] * TOTAL_SIZE
-        countByColor = QuantizerMap.quantize(pixels)
-        for (pixel, count) in countByColor.items():
-            red = redFromArgb(pixel)
-            green = greenFromArgb(pixel)
-            blue = blueFromArgb(pixel)
-            bitsToRemove = 8 - INDEX_BITS
-            iR = (red >> bitsToRemove) + 1
-            iG = (green >> bitsToRemove) + 1
-            iB = (blue >> bitsToRemove) + 1
-            index = self.getIndex(iR, iG, iB)
-            self.weights[index] = (self.weights[index] if len(self.weights) > index else 0) + count
-            self.momentsR[index] += count * red
-            self.momentsG[index] += count * green
-            self.momentsB[index] += count * blue
-            self.moments[index] += count * (red * red + green * green + blue * blue)
+    def constructHistogram(self, pixels, counts=None):
+        if (counts is None):
+            countByColor = QuantizerMap.quantize(pixels)
+            pixels = list(countByColor.keys())
+            counts = list(countByColor.values())
+        # // The channels are kept as separate arrays, and each moment is
+        # // accumulated over every color with a single bincount.
+        pixels = np.asarray(pixels, dtype=np.uint32)
+        counts = np.asarray(counts, dtype=np.float64)
+        red = ((pixels >> 16) & 255).astype(np.int64)
+        green = ((pixels >> 8) & 255).astype(np.int64)
+        blue = (pixels & 255).astype(np.int64)
+        bitsToRemove = 8 - INDEX_BITS
+        iR = (red >> bitsToRemove) + 1
+        iG = (green >> bitsToRemove) + 1
+        iB = (blue >> bitsToRemove) + 1
+        index = self.getIndex(iR, iG, iB)
+        self.weights = self.histogram(index, counts)
+        self.momentsR = self.histogram(index, counts * red)
+        self.momentsG = self.histogram(index, counts * green)
+        self.momentsB = self.histogram(index, counts * blue)
+        self.moments = self.histogram(index, counts * (red * red + green * green + blue * blue))
+
+    def histogram(self, index, weights):
+        return np.bincount(index, weights=weights, minlength=TOTAL_SIZE).astype(np.int64).tolist()
 
     def computeMoments(self):
         for r in range(1, SIDE_LENGTH):
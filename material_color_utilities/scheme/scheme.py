@@ -3,6 +3,7 @@ from curses import termattrs
 from regex import P
 from ..palettes.core_palette import *
 import json
+from functools import lru_cache
 
 # /**
 #  * Represents a Material color scheme, a mapping of color roles to colors.
@@ -127,7 +128,16 @@ class Scheme:
     #  */
     @staticmethod
     def light(argb):
-        core = CorePalette.of(argb)
+        # // Only the role -> color pairs are cached; each call gets a fresh props dict.
+        return Scheme(dict(_light_props(argb)))
+
+    # /**
+    #  * @param core A CorePalette to build the scheme from; its tone caches are
+    #  *     shared with anything else built from the same palette.
+    #  * @return Light Material color scheme, based on the palette's hue.
+    #  */
+    @staticmethod
+    def lightFromCorePalette(core):
         return Scheme({
             "primary" : core.a1.tone(40),
             "onPrimary" : core.a1.tone(100),
@@ -164,7 +174,16 @@ class Scheme:
     #  */
     @staticmethod
     def dark(argb):
-        core = CorePalette.of(argb);
+        # // Only the role -> color pairs are cached; each call gets a fresh props dict.
+        return Scheme(dict(_dark_props(argb)))
+
+    # /**
+    #  * @param core A CorePalette to build the scheme from; its tone caches are
+    #  *     shared with anything else built from the same palette.
+    #  * @return Dark Material color scheme, based on the palette's hue.
+    #  */
+    @staticmethod
+    def darkFromCorePalette(core):
         return Scheme({
             "primary" : core.a1.tone(80),
             "onPrimary" : core.a1.tone(20),
@@ -197,3 +216,13 @@ class Scheme:
 
     def toJSON(self):
         return json.dumps(self.props)
+
+
+@lru_cache(maxsize=128)
+def _light_props(argb):
+    return tuple(Scheme.lightFromCorePalette(CorePalette.of(argb)).props.items())
+
+
+@lru_cache(maxsize=128)
+def _dark_props(argb):
+    return tuple(Scheme.darkFromCorePalette(CorePalette.of(argb)).props.items())
@@ -1,8 +1,11 @@
-from ..hct.cam16 import *
-from ..utils.color_utils import fr
-from ..utils.math_utils import *
+from ..hct.cam16 import Cam16
+from ..hct.viewing_conditions import ViewingConditions
+from ..utils.color_utils import lstar_from_argb
+from ..utils.math_utils import difference_degrees, sanitize_degrees_int
 from collections import OrderedDict
 
+import numpy as np
+
 # /**
 #  *  Given a large set of colors, remove colors that are unsuitable for a UI
 #  *  theme, and rank the rest based on suitability.
@@ -37,13 +40,17 @@ class Score:
         # // Turn the count of each color into a proportion by dividing by the total
         # // count. Also, fill a cache of CAM16 colors representing each color, and
         # // record the proportion of colors for each CAM16 hue.
+        # // The CAM16 conversion runs once over every color as a batch, in fp32,
+        # // which is more than precise enough to rank colors.
         colorsToProportion = OrderedDict()
         colorsToCam = OrderedDict()
         hueProportions = [0] * 361
-        for (color, population) in colorsToPopulation.items():
+        colors = np.fromiter(colorsToPopulation.keys(), dtype=np.uint32, count=len(colorsToPopulation))
+        cams = Cam16.from_ints_in_viewing_conditions(colors, ViewingConditions.DEFAULT, compute_full=False, precision='fp32')
+        for (i, (color, population)) in enumerate(colorsToPopulation.items()):
             proportion = population / populationSum
             colorsToProportion[color] = proportion
-            cam = Cam16.fromInt(color)
+            cam = cams[i]
             colorsToCam[color] = cam
             hue = round(cam.hue)
             hueProportions[hue] += proportion
@@ -54,7 +61,7 @@ class Score:
             hue = round(cam.hue)
             excitedProportion = 0
             for i in range((hue - 15), (hue + 15)):
-                neighborHue = sanitizeDegreesInt(i)
+                neighborHue = sanitize_degrees_int(i)
                 excitedProportion += hueProportions[neighborHue]
             colorsToExcitedProportion[color] = excitedProportion
         # // Score the colors by their proportion, as well as how chromatic they are.
@@ -75,7 +82,7 @@ class Score:
             hue = colorsToCam[color].hue
             for alreadyChosenColor in dedupedColorsToScore:
                 alreadyChosenHue = colorsToCam[alreadyChosenColor].hue
-                if (differenceDegrees(hue, alreadyChosenHue) < 15):
+                if (difference_degrees(hue, alreadyChosenHue) < 15):
                     duplicateHue = True
                     break
             if (duplicateHue):
@@ -97,7 +104,7 @@ class Score:
         for (color, cam) in colorsToCam.items():
             proportion = colorsToExcitedProportion[color]
             if (cam.chroma >= Score.CUTOFF_CHROMA and
-                lstarFromArgb(color) >= Score.CUTOFF_TONE and
+                lstar_from_argb(color) >= Score.CUTOFF_TONE and
                 proportion >= Score.CUTOFF_EXCITED_PROPORTION):
                 filtered.append(color)
         return filtered
@@ -0,0 +1,87 @@
+"""
+Compiled kernels for color space conversions over arrays of colors.
+
+The kernels take their lookup tables and matrices as arguments, so one
+kernel serves both float32 and float64 working precision.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(fastmath=True, cache=True)
+def argb_to_xyz_batch(argbs, lut, matrix, out):
+    """
+    Converts colors in ARGB format to XYZ.
+
+    Args:
+        argbs (np.ndarray): The ARGB colors, as a uint32 array of length n.
+        lut (np.ndarray): The 256-entry linearization table.
+        matrix (np.ndarray): The 3x3 sRGB to XYZ matrix, with the dtype of out.
+        out (np.ndarray): An n x 3 array that receives X, Y and Z.
+    """
+
+    m00, m01, m02 = matrix[0, 0], matrix[0, 1], matrix[0, 2]
+    m10, m11, m12 = matrix[1, 0], matrix[1, 1], matrix[1, 2]
+    m20, m21, m22 = matrix[2, 0], matrix[2, 1], matrix[2, 2]
+    for i in range(argbs.shape[0]):
+        argb = argbs[i]
+        r = lut[(argb >> 16) & 255]
+        g = lut[(argb >> 8) & 255]
+        b = lut[argb & 255]
+        out[i, 0] = m00 * r + m01 * g + m02 * b
+        out[i, 1] = m10 * r + m11 * g + m12 * b
+        out[i, 2] = m20 * r + m21 * g + m22 * b
+
+
+@njit(cache=True, inline='always')
+def labf_njit(t):
+    """
+    color_utils.labf for compiled callers; Numba has no math.cbrt, so this uses np.cbrt.
+    """
+
+    e = 216.0 / 24389.0
+    kappa = 24389.0 / 27.0
+
+    if t > e:
+        return np.cbrt(t)
+
+    return (kappa * t + 16) / 116
+
+
+@njit(fastmath=True, cache=True)
+def argb_to_lab_batch(argbs, lut, matrix, white_point, out):
+    """
+    Converts colors in ARGB format to L*a*b*.
+
+    Linearization, the XYZ multiply and the Lab transfer function are fused, so
+    no intermediate XYZ array is allocated. The loop is serial: it runs on the
+    image quantization path, which may be entered from several threads at once,
+    and Numba's default workqueue threading layer aborts on concurrent parallel
+    launches.
+
+    Args:
+        argbs (np.ndarray): The ARGB colors, as a uint32 array of length n.
+        lut (np.ndarray): The 256-entry linearization table.
+        matrix (np.ndarray): The 3x3 sRGB to XYZ matrix.
+        white_point (np.ndarray): The XYZ of the reference white.
+        out (np.ndarray): An n x 3 array that receives L*, a* and b*.
+    """
+
+    m00, m01, m02 = matrix[0, 0], matrix[0, 1], matrix[0, 2]
+    m10, m11, m12 = matrix[1, 0], matrix[1, 1], matrix[1, 2]
+    m20, m21, m22 = matrix[2, 0], matrix[2, 1], matrix[2, 2]
+    wx = 1.0 / white_point[0]
+    wy = 1.0 / white_point[1]
+    wz = 1.0 / white_point[2]
+    for i in range(argbs.shape[0]):
+        argb = argbs[i]
+        r = lut[(argb >> 16) & 255]
+        g = lut[(argb >> 8) & 255]
+        b = lut[argb & 255]
+        fx = labf_njit((m00 * r + m01 * g + m02 * b) * wx)
+        fy = labf_njit((m10 * r + m11 * g + m12 * b) * wy)
+        fz = labf_njit((m20 * r + m21 * g + m22 * b) * wz)
+        out[i, 0] = 116.0 * fy - 16
+        out[i, 1] = 500.0 * (fx - fy)
+        out[i, 2] = 200.0 * (fy - fz)
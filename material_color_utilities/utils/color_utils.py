@@ -7,7 +7,8 @@ conversions that aren't HCT or CAM16.
 
 
 from typing import Any
-from .math_utils import clamp_int, matrix_multiply
+from .math_utils import matrix_multiply_batch
+from ._color_kernels import argb_to_lab_batch, argb_to_xyz_batch, labf_njit
 
 import math
 import numpy as np
@@ -44,21 +45,31 @@ XYZ_TO_SRGB: ndarray[Any, dtype[Any]] = np.array(
 WHITE_POINT_D65: ndarray[Any, dtype[Any]] = np.array([95.047, 100.0, 108.883])
 
 
-@njit
-def rshift(val, n) -> Any:
+def _build_linearized_lut() -> ndarray[Any, dtype[Any]]:
     """
-    Converts a color from RGB components to ARGB format.
+    Evaluates the sRGB linearization curve for every 8-bit channel value.
     """
 
-    return val >> n if val >= 0 else (val + 0x100000000) >> n
+    normalized = np.arange(256, dtype=np.float64) / 255.0
+    return np.where(
+        normalized <= 0.040449936,
+        normalized / 12.92 * 100.0,
+        np.power((normalized + 0.055) / 1.055, 2.4) * 100.0,
+    )
+
+
+LINEARIZED_LUT: ndarray[Any, dtype[Any]] = _build_linearized_lut()
+LINEARIZED_LUT32: ndarray[Any, dtype[Any]] = LINEARIZED_LUT.astype(np.float32)
 
 
-@njit
 def argb_from_rgb(red, green, blue) -> Any:
-    return rshift((255 << 24 | (red & 255) << 16 | (green & 255) << 8 | blue & 255), 0)
+    """
+    Converts a color from RGB components to ARGB format.
+    """
+
+    return 255 << 24 | (red & 255) << 16 | (green & 255) << 8 | blue & 255
 
 
-@njit
 def alpha_from_argb(argb) -> Any:
     """
     Returns the alpha component of a color in ARGB format.
@@ -67,7 +78,6 @@ def alpha_from_argb(argb) -> Any:
     return argb >> 24 & 255
 
 
-@njit
 def red_from_argb(argb) -> Any:
     """
     Returns the red component of a color in ARGB format.
@@ -76,7 +86,6 @@ def red_from_argb(argb) -> Any:
     return argb >> 16 & 255
 
 
-@njit
 def green_from_argb(argb) -> Any:
     """
     Returns the green component of a color in ARGB format.
@@ -85,7 +94,6 @@ def green_from_argb(argb) -> Any:
     return argb >> 8 & 255
 
 
-@njit
 def blue_from_argb(argb) -> Any:
     """
     Returns the blue component of a color in ARGB format.
@@ -94,7 +102,6 @@ def blue_from_argb(argb) -> Any:
     return argb & 255
 
 
-@njit
 def is_opaque(argb) -> Any:
     """
     Returns whether a color in ARGB format is opaque.
@@ -116,7 +123,23 @@ def argb_from_xyz(x, y, z) -> Any:
     r = delinearized(linearr)
     g = delinearized(linearg)
     b = delinearized(linearb)
-    return argb_from_rgb(r, g, b)
+    return 0xFF000000 | (r << 16) | (g << 8) | b
+
+
+def argbs_from_xyz(xyz) -> ndarray[Any, dtype[Any]]:
+    """
+    Converts an array of colors in XYZ to ARGB format.
+
+    Args:
+        xyz: An n x 3 array of X, Y and Z.
+
+    Returns:
+        The ARGB colors, as a uint32 array.
+    """
+
+    linear = matrix_multiply_batch(np.asarray(xyz, dtype=np.float64).reshape(-1, 3), XYZ_TO_SRGB)
+    rgb = delinearized_vec(linear).astype(np.uint32)
+    return 0xFF000000 | (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
 
 
 @njit
@@ -125,10 +148,39 @@ def xyz_from_argb(argb):
     Converts a color from XYZ to ARGB.
     """
 
-    r = linearized(red_from_argb(argb))
-    g = linearized(green_from_argb(argb))
-    b = linearized(blue_from_argb(argb))
-    return matrix_multiply([r, g, b], SRGB_TO_XYZ)
+    r = LINEARIZED_LUT[(argb >> 16) & 255]
+    g = LINEARIZED_LUT[(argb >> 8) & 255]
+    b = LINEARIZED_LUT[argb & 255]
+    m = SRGB_TO_XYZ
+    x = m[0, 0] * r + m[0, 1] * g + m[0, 2] * b
+    y = m[1, 0] * r + m[1, 1] * g + m[1, 2] * b
+    z = m[2, 0] * r + m[2, 1] * g + m[2, 2] * b
+    return (x, y, z)
+
+
+def xyz_from_argbs(argbs, float_type=np.float64, out=None) -> ndarray[Any, dtype[Any]]:
+    """
+    Converts an array of colors in ARGB format to XYZ.
+
+    Args:
+        argbs: The ARGB colors.
+        float_type: The working precision, np.float64 or np.float32.
+        out: Optional preallocated n x 3 array of float_type to write into, so
+            repeated conversions can reuse one buffer.
+
+    Returns:
+        An n x 3 array of X, Y and Z.
+    """
+
+    argbs = np.ascontiguousarray(argbs, dtype=np.uint32).reshape(-1)
+    lut = LINEARIZED_LUT32 if np.dtype(float_type) == np.float32 else LINEARIZED_LUT
+    if (out is None):
+        out = np.empty((argbs.shape[0], 3), dtype=lut.dtype)
+    elif (not isinstance(out, np.ndarray) or out.shape != (argbs.shape[0], 3) or out.dtype != lut.dtype
+            or not out.flags.writeable):
+        raise ValueError('out must be a writeable ' + str(argbs.shape[0]) + ' x 3 array of ' + str(lut.dtype))
+    argb_to_xyz_batch(argbs, lut, SRGB_TO_XYZ.astype(lut.dtype), out)
+    return out
 
 
 @njit
@@ -171,7 +223,45 @@ def argd_from_lab(l, a, b):
     return argb_from_xyz(x, y, z)
 
 
-@njit
+def lab_invf_vec(ft) -> ndarray[Any, dtype[Any]]:
+    """
+    Applies lab_invf to every value in an array.
+    """
+
+    e = 216.0 / 24389.0
+    kappa = 24389.0 / 27.0
+    ft3 = ft * ft * ft
+    return np.where(ft3 > e, ft3, (116 * ft - 16) / kappa)
+
+
+def argbs_from_lab(l, a, b) -> ndarray[Any, dtype[Any]]:
+    """
+    Converts arrays of L*a*b* color values to ARGB color values.
+
+    Args:
+        l (np.ndarray): The lightness values.
+        a (np.ndarray): The green-red values.
+        b (np.ndarray): The blue-yellow values.
+
+    Returns:
+        np.ndarray: The ARGB colors, as a uint32 array.
+    """
+
+    fy = (np.asarray(l, dtype=np.float64) + 16.0) / 116.0
+    fx = np.asarray(a, dtype=np.float64) / 500.0 + fy
+    fz = fy - np.asarray(b, dtype=np.float64) / 200.0
+    xyz = np.stack((lab_invf_vec(fx), lab_invf_vec(fy), lab_invf_vec(fz)), axis=-1) * WHITE_POINT_D65
+    return argbs_from_xyz(xyz)
+
+
+# math.cbrt is only available from Python 3.11.
+if hasattr(math, 'cbrt'):
+    _cbrt = math.cbrt
+else:
+    def _cbrt(x):
+        return math.pow(x, 1.0 / 3.0)
+
+
 def labf(t) -> Any:
     """
     Calculate the lightness adjustment factor for a given value.
@@ -180,7 +270,21 @@ def labf(t) -> Any:
     e: float = 216.0 / 24389.0
     kappa: float = 24389.0 / 27.0
 
-    return np.where(t > e, np.power(t, 1.0 / 3.0), (kappa * t + 16) / 116)
+    if t > e:
+        return _cbrt(t)
+
+    return (kappa * t + 16) / 116
+
+
+def labf_vec(t) -> ndarray[Any, dtype[Any]]:
+    """
+    Calculate the lightness adjustment factor for every value in an array.
+    """
+
+    e: float = 216.0 / 24389.0
+    kappa: float = 24389.0 / 27.0
+
+    return np.where(t > e, np.cbrt(t), (kappa * t + 16) / 116)
 
 
 @njit
@@ -189,70 +293,121 @@ def lab_from_argb(argb):
     Converts ARGB color value to LAB color values.
     """
 
-    linearr_gb = np.array([linearized(red_from_argb(argb)), 
-                          linearized(green_from_argb(argb)), 
-                          linearized(blue_from_argb(argb))])
-    matrix = np.array(SRGB_TO_XYZ)
-    xyz = np.dot(matrix, linearr_gb)
-    white_point = np.array(WHITE_POINT_D65)
-    normalized_xyz = xyz / white_point
-    fxyz = labf(normalized_xyz)
-    l = 116.0 * fxyz[1] - 16
-    a = 500.0 * (fxyz[0] - fxyz[1])
-    b = 200.0 * (fxyz[1] - fxyz[2])
-    return [l, a, b]
+    x, y, z = xyz_from_argb(argb)
+    white_point = WHITE_POINT_D65
+    fx = labf_njit(x / white_point[0])
+    fy = labf_njit(y / white_point[1])
+    fz = labf_njit(z / white_point[2])
+    l = 116.0 * fy - 16
+    a = 500.0 * (fx - fy)
+    b = 200.0 * (fy - fz)
+    return (l, a, b)
+
+
+def lab_from_argbs(argbs) -> ndarray[Any, dtype[Any]]:
+    """
+    Converts an array of colors in ARGB format to L*a*b*.
+
+    Args:
+        argbs: The ARGB colors.
+
+    Returns:
+        An n x 3 array of L*, a* and b*.
+    """
+
+    argbs = np.ascontiguousarray(argbs, dtype=np.uint32).reshape(-1)
+    out = np.empty((argbs.shape[0], 3), dtype=np.float64)
+    argb_to_lab_batch(argbs, LINEARIZED_LUT, SRGB_TO_XYZ, WHITE_POINT_D65, out)
+    return out
 
 
 @njit
 def argb_From_lstar(lstar):
-    fy = (lstar + 16.0) / 116.0
-    fz = fy
-    fx = fy
-
+    # fx, fy and fz are equal for a gray, and L* > 8 holds exactly when
+    # fy^3 > epsilon, so X, Y and Z share one normalized value.
     kappa = 24389.0 / 27.0
-    epsilon = 216.0 / 24389.0
-    l_exceeds_epsilon_kappa = lstar > 8.0
 
-    y = fy * fy * fy if l_exceeds_epsilon_kappa else lstar / kappa
+    if lstar > 8.0:
+        fy = (lstar + 16.0) / 116.0
+        t = fy * fy * fy
+    else:
+        t = lstar / kappa
 
-    cube_exceed_epsilon = fy * fy * fy > epsilon
+    white_point = WHITE_POINT_D65
 
-    x = fx * fx * fx if cube_exceed_epsilon else lstar / kappa
-    z = fz * fz * fz if cube_exceed_epsilon else lstar / kappa
+    return argb_from_xyz(t * white_point[0], t * white_point[1], t * white_point[2])
 
-    white_point = WHITE_POINT_D65
 
-    return argb_from_xyz(x * white_point[0], y * white_point[1], z * white_point[2])
+def argbs_from_lstar(lstars) -> ndarray[Any, dtype[Any]]:
+    """
+    Converts an array of L* values to the gray ARGB colors with those L*.
+    """
+
+    lstars = np.asarray(lstars, dtype=np.float64)
+    fy = (lstars + 16.0) / 116.0
+    kappa = 24389.0 / 27.0
+    # // L* > 8 exactly when fy^3 exceeds epsilon, so one test covers all three channels.
+    t = np.where(lstars > 8.0, fy * fy * fy, lstars / kappa)
+    return argbs_from_xyz(t[:, np.newaxis] * WHITE_POINT_D65)
 
 
-@njit
+@njit(cache=True, fastmath=True, inline='always')
 def lstar_from_argb(argb):
-    y = xyz_from_argb(argb)[1] / 100.0
+    """
+    Computes the L* of a color in ARGB format.
+
+    Only the Y row of the sRGB to XYZ matrix is needed, so X and Z are not computed.
+    """
+
+    r = LINEARIZED_LUT[(argb >> 16) & 255]
+    g = LINEARIZED_LUT[(argb >> 8) & 255]
+    b = LINEARIZED_LUT[argb & 255]
+    y = (0.2126 * r + 0.7152 * g + 0.0722 * b) / 100.0
     e = 216.0 / 24389.0
 
     if y <= e:
         return 24389.0 / 27.0 * y
 
-    y_intermediate = math.pow(y, 1.0 / 3.0)
-    return 116.0 * y_intermediate - 16.0
+    return 116.0 * np.cbrt(y) - 16.0
+
+
+def lstars_from_argbs(argbs) -> ndarray[Any, dtype[Any]]:
+    """
+    Computes the L* of every color in an array of ARGB colors.
+    """
+
+    argbs = np.asarray(argbs, dtype=np.uint32)
+    r = LINEARIZED_LUT[(argbs >> 16) & 255]
+    g = LINEARIZED_LUT[(argbs >> 8) & 255]
+    b = LINEARIZED_LUT[argbs & 255]
+    y = (0.2126 * r + 0.7152 * g + 0.0722 * b) / 100.0
+    e = 216.0 / 24389.0
+
+    return np.where(y <= e, 24389.0 / 27.0 * y, 116.0 * np.cbrt(y) - 16.0)
 
 
 @njit
 def y_from_lstar(lstar):
     if lstar > 8:
-        return math.pow((lstar + 16.0) / 116.0, 3.0) * 100.0
+        ft = (lstar + 16.0) / 116.0
+        return ft * ft * ft * 100.0
 
     return lstar / (24389.0 / 27.0) * 100.0
 
 
-@njit
 def linearized(rgbComponent):
-    normalized = rgbComponent / 255.0
+    """
+    Linearizes an 8-bit RGB component.
 
-    if normalized <= 0.040449936:
-        return normalized / 12.92 * 100.0
+    Args:
+        rgbComponent: An integer 0 <= rgbComponent <= 255, or an integer
+            ndarray of components.
+
+    Returns:
+        The linear RGB component(s), 0.0 <= output <= 100.0.
+    """
 
-    return np.power((normalized + 0.055) / 1.055, 2.4) * 100.0
+    return LINEARIZED_LUT[rgbComponent]
 
 
 @njit
@@ -266,7 +421,28 @@ def delinearized(rgbComponent):
     else:
         delinearized = 1.055 * math.pow(normalized, 1.0 / 2.4) - 0.055
 
-    return clamp_int(0, 255, round(delinearized * 255.0))
+    value = round(delinearized * 255.0)
+    return 0 if value < 0 else 255 if value > 255 else value
+
+
+def delinearized_vec(rgbComponents) -> ndarray[Any, dtype[Any]]:
+    """
+    Delinearizes every linear RGB component in an array.
+
+    Args:
+        rgbComponents: Linear RGB components, 0.0 <= rgbComponent <= 100.0.
+
+    Returns:
+        The 8-bit RGB components, as integers in 0..255 stored as float64.
+    """
+
+    normalized = np.asarray(rgbComponents, dtype=np.float64) / 100.0
+    delinearized = np.where(
+        normalized <= 0.0031308,
+        normalized * 12.92,
+        1.055 * np.power(np.maximum(normalized, 0.0031308), 1.0 / 2.4) - 0.055,
+    )
+    return np.clip(np.round(delinearized * 255.0), 0, 255)
 
 
 @njit
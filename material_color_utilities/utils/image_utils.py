@@ -1,13 +1,10 @@
 from ..quantize.quantizer_celebi import QuantizerCelebi
 from ..score.score import Score
-from .color_utils import argb_from_rgb
 
 import numpy as np
-from numba import njit
 from PIL import Image
 
 
-@njit
 def SourceColorFromImage(image):
     """
     Get the source color from an image.
@@ -19,22 +16,38 @@ def SourceColorFromImage(image):
         The source color, which is the color most suitable for creating a UI theme.
     """
 
-    if (image.mode != 'RGBA'):
-        print("Warning: Image not in RGB|RGBA format - Converting...")
-        image = image.convert('RGBA')
-
-    pixels = []
-    np_image = np.array(image)
-
-    for pixel in np_image.reshape(-1, 4):
-        r, g, b, a = pixel
-
-        if (a < 255):
-            continue
-        
-        argb = argb_from_rgb(r, g, b)
-        pixels.append(argb)
-
-    result = QuantizerCelebi.quantize(pixels, 128)
+    # Keep an alpha channel only if the source has transparency to filter on,
+    # including color-keyed (tRNS) RGB and palette images.
+    has_alpha = image.mode in ('RGBA', 'LA', 'La', 'PA', 'RGBa') or 'transparency' in image.info
+    target_mode = 'RGBA' if has_alpha else 'RGB'
+    owned = False
+    if (image.mode != target_mode):
+        if (image.mode not in ('RGB', 'RGBA')):
+            print("Warning: Image not in RGB|RGBA format - Converting...")
+        image = image.convert(target_mode)
+        owned = True
+
+    # A 128x128 sample is plenty for seed color extraction and keeps the
+    # quantizer and CAM16 work independent of the input resolution. thumbnail
+    # works in place, so only the caller's image needs copying first.
+    if (image.width > 128 or image.height > 128):
+        if (not owned):
+            image = image.copy()
+        image.thumbnail((128, 128), Image.Resampling.LANCZOS)
+
+    # Wrap the raw buffer instead of going through the array interface.
+    channels = 4 if image.mode == 'RGBA' else 3
+    np_image = np.frombuffer(image.tobytes(), dtype=np.uint8).reshape(-1, channels)
+
+    # Keep fully opaque pixels only and pack them into ARGB integers in one pass.
+    # RGB images have no alpha channel, so every pixel is opaque.
+    if (channels == 4):
+        np_image = np_image[np_image[:, 3] == 255]
+    rgb = np_image.astype(np.uint32)
+    pixels = 0xFF000000 | (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+
+    # Quantize the histogram of distinct colors rather than every pixel.
+    colors, counts = np.unique(pixels, return_counts=True)
+    result = QuantizerCelebi.quantize(colors.tolist(), 128, counts.tolist())
     ranked = Score.score(result)
     return ranked[0]
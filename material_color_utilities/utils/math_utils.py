@@ -2,6 +2,7 @@
 Utility methods for mathematical operations.
 """
 
+import math
 import numpy as np
 from numba import njit
 
@@ -17,14 +18,12 @@ def signum(num):
         1 if num > 0, -1 if num < 0, and 0 if num = 0.
     """
 
-    if num < 0:
-        return -1
-    elif num == 0:
-        return 0
-    return 1
+    return int(num > 0) - int(num < 0)
+
+
+signum_njit = njit(cache=True, inline='always')(signum)
 
 
-@njit
 def lerp(start, stop, amount):
     """
     Performs linear interpolation between two values.
@@ -41,50 +40,38 @@ def lerp(start, stop, amount):
     return (1.0 - amount) * start + amount * stop
 
 
-@njit
-def clamp_int(min, max, input):
+def clamp_int(min_value, max_value, input):
     """
     Clamps an integer value between a minimum and maximum value.
 
     Args:
-        min (int): The minimum value to clamp to.
-        max (int): The maximum value to clamp to.
+        min_value (int): The minimum value to clamp to.
+        max_value (int): The maximum value to clamp to.
         input (int): The input value to be clamped.
 
     Returns:
         int: The clamped value.
     """
 
-    if input < min:
-        return min
-    elif input > max:
-        return max
-    return input
+    return min_value if input < min_value else max_value if input > max_value else input
 
 
-@njit
-def clamp_double(min, max, input):
+def clamp_double(min_value, max_value, input):
     """
     Clamps a double value between a minimum and maximum value.
 
     Args:
-        min (float): The minimum value to clamp to.
-        max (float): The maximum value to clamp to.
+        min_value (float): The minimum value to clamp to.
+        max_value (float): The maximum value to clamp to.
         input (float): The input value to be clamped.
 
     Returns:
         float: The clamped value.
     """
 
-
-    if input < min:
-        return min
-    elif input > max:
-        return max
-    return input
+    return min_value if input < min_value else max_value if input > max_value else input
 
 
-@njit
 def sanitize_degrees_int(degrees):
     """
     Sanitizes an integer value representing degrees by ensuring it falls within the range of 0 to 359.
@@ -97,15 +84,10 @@ def sanitize_degrees_int(degrees):
     """
 
 
-    degrees = degrees % 360
-
-    if degrees < 0:
-        degrees = degrees + 360
-
-    return degrees
+    # Python (and Numba) modulo already takes the sign of the divisor.
+    return degrees % 360
 
 
-@njit
 def sanitize_degrees_double(degrees):
     """
     Sanitizes a floating-point value representing degrees by ensuring it falls within the range of 0.0 to 359.0.
@@ -118,15 +100,12 @@ def sanitize_degrees_double(degrees):
     """
 
 
-    degrees = degrees % 360.0
+    return degrees - 360.0 * math.floor(degrees * (1.0 / 360.0))
 
-    if degrees < 0:
-        degrees = degrees + 360.0
 
-    return degrees
+sanitize_degrees_double_njit = njit(cache=True, inline='always')(sanitize_degrees_double)
 
 
-@njit
 def difference_degrees(a, b):
     """
     Calculates the difference in degrees between two values.
@@ -139,20 +118,19 @@ def difference_degrees(a, b):
         float: The difference in degrees between the two values.
     """
 
-    return 180.0 - np.abs(np.abs(a - b) - 180.0)
+    return 180.0 - abs(abs(a - b) - 180.0)
 
 
-@njit
-def matrix_multiply(row, matrix):
+def matrix_multiply_batch(rows, matrix):
     """
-    Multiplies a row vector by a 3x3 matrix.
+    Multiplies a 3x3 matrix by every row vector in an n x 3 array.
 
     Args:
-        row (List[float]): The row vector to be multiplied.
-        matrix (List[List[float]]): The 3x3 matrix to multiply the row vector with.
+        rows (np.ndarray): The n x 3 array of row vectors.
+        matrix (np.ndarray): The 3x3 matrix to multiply each row vector by.
 
     Returns:
-        np.ndarray: The result of multiplying the row vector by the matrix.
+        np.ndarray: The n x 3 array of products, row i being matrix @ rows[i].
     """
 
-    return np.dot(row, matrix)
+    return np.asarray(rows) @ np.asarray(matrix).T
@@ -1,11 +1,27 @@
-from .color_utils import red_from_argb, green_from_argb, blue_from_argb, rshift
+import string
+
+import numpy as np
+
+# Value of each byte as a hex digit. Bytes that are not hex digits map to
+# 0x10, so a single membership test on the translated digits catches them.
+_INVALID_NIBBLE = 0x10
+_NIBBLES = bytes(int(chr(c), 16) if chr(c) in string.hexdigits else _INVALID_NIBBLE for c in range(256))
+
+# Two-digit lowercase hex for each channel value.
+_HEX256 = [f'{i:02x}' for i in range(256)]
+
 
 def hex_from_argb(argb):
-    r = red_from_argb(argb)
-    g = green_from_argb(argb)
-    b = blue_from_argb(argb)
+    return '#' + _HEX256[(argb >> 16) & 255] + _HEX256[(argb >> 8) & 255] + _HEX256[argb & 255]
+
 
-    return f'#{r:02x}{g:02x}{b:02x}'
+def hex_from_argbs(argbs):
+    argbs = np.asarray(argbs, dtype=np.uint32)
+    reds = ((argbs >> 16) & 255).tolist()
+    greens = ((argbs >> 8) & 255).tolist()
+    blues = (argbs & 255).tolist()
+
+    return ['#' + _HEX256[r] + _HEX256[g] + _HEX256[b] for r, g, b in zip(reds, greens, blues)]
 
 
 def parse_int_hex(value):
@@ -14,26 +30,25 @@ def parse_int_hex(value):
 
 def argb_from_hex(hex):
     hex = hex.replace('#', '')
-    isThree = len(hex) == 3
-    isSix = len(hex) == 6
-    isEight = len(hex) == 8
-    if (not isThree and not isSix and not isEight):
+    length = len(hex)
+    if (length != 3 and length != 6 and length != 8):
         raise Exception('unexpected hex ' + hex)
-    
-    r = 0
-    g = 0
-    b = 0
-    if (isThree):
-        r = parse_int_hex(hex[0:1]*2)
-        g = parse_int_hex(hex[1:2]*2)
-        b = parse_int_hex(hex[2:3]*2)
-    elif (isSix):
-        r = parse_int_hex(hex[0:2])
-        g = parse_int_hex(hex[2:4])
-        b = parse_int_hex(hex[4:6])
-    elif (isEight):
-        r = parse_int_hex(hex[2:4])
-        g = parse_int_hex(hex[4:6])
-        b = parse_int_hex(hex[6:8])
-    
-    return rshift(((255 << 24) | ((r & 0x0ff) << 16) | ((g & 0x0ff) << 8) | (b & 0x0ff)), 0)
+
+    nibbles = hex.encode('ascii', 'replace').translate(_NIBBLES)
+    if (_INVALID_NIBBLE in nibbles):
+        raise ValueError('invalid hex digit in ' + hex)
+
+    if (length == 3):
+        r = nibbles[0] * 17
+        g = nibbles[1] * 17
+        b = nibbles[2] * 17
+    elif (length == 6):
+        r = (nibbles[0] << 4) | nibbles[1]
+        g = (nibbles[2] << 4) | nibbles[3]
+        b = (nibbles[4] << 4) | nibbles[5]
+    else:
+        r = (nibbles[2] << 4) | nibbles[3]
+        g = (nibbles[4] << 4) | nibbles[5]
+        b = (nibbles[6] << 4) | nibbles[7]
+
+    return 0xFF000000 | (r << 16) | (g << 8) | b
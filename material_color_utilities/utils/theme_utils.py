@@ -3,6 +3,19 @@ from ..palettes.core_palette import CorePalette
 from ..scheme.scheme import Scheme
 from .image_utils import SourceColorFromImage
 
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def _harmonize_cached(design_color, source_color):
+    """
+    Blend.harmonize, memoized on the (design, source) pair so repeated custom
+    colors against the same source are only harmonized once.
+    """
+
+    return Blend.harmonize(design_color, source_color)
+
+
 def custom_color(source, color):
     """
     Customizes a color based on the provided source and color.
@@ -40,8 +53,8 @@ def custom_color(source, color):
     from_v = value
     to = source
 
-    if (color["blend"]):
-        value = Blend.harmonize(from_v, to)
+    if (color["blend"] and from_v != to):
+        value = _harmonize_cached(from_v, to)
 
     palette = CorePalette.of(value)
     tones = palette.a1
@@ -101,11 +114,15 @@ def theme_from_source_color(source, custom_colors=None):
 
     palette = CorePalette.of(source)
 
+    # Custom colors are solved serially: HCT solving is pure Python and the Numba
+    # kernels it calls hold the GIL, so a thread pool only adds start-up cost.
+    customs = [custom_color(source, c) for c in custom_colors]
+
     return {
         "source": source,
         "schemes": {
-            "light": Scheme.light(source),
-            "dark": Scheme.dark(source),
+            "light": Scheme.lightFromCorePalette(palette),
+            "dark": Scheme.darkFromCorePalette(palette),
         },
         "palettes": {
             "primary": palette.a1,
@@ -115,7 +132,7 @@ def theme_from_source_color(source, custom_colors=None):
             "neutralVariant": palette.n2,
             "error": palette.error,
         },
-        "custom_colors": [custom_color(source, c) for c in custom_colors]
+        "custom_colors": customs
     }
 
 